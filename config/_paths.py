@@ -0,0 +1,11 @@
+"""Shared filesystem layout for the master configs, computed once at import."""
+from pathlib import Path
+
+_BASE = Path(__file__).resolve().parent.parent
+_RES = _BASE / "ressources"
+
+BASE_DIR = str(_BASE)
+RES_DIR = str(_RES)
+DOWNLOAD_DIR = str(_RES / "downloads")
+EXTRACT_DIR = str(_RES / "downloads" / "extracted")
+OUTPUT_DIR = RES_DIR
@@ -1,27 +1,44 @@
 
 import os
+import re
+from types import MappingProxyType
 
-BASE_DIR = os.path.dirname(os.path.dirname(__file__))
-RES_DIR = os.path.join(BASE_DIR, "ressources")
-DOWNLOAD_DIR = os.path.join(RES_DIR, "downloads")
-EXTRACT_DIR = os.path.join(DOWNLOAD_DIR, "extracted")
-OUTPUT_DIR = RES_DIR
+from config._paths import (
+    BASE_DIR, RES_DIR, DOWNLOAD_DIR, EXTRACT_DIR, OUTPUT_DIR,
+)
+
+LOGIN_URL = "https://digstu.hhu.de/qisserver/pages/cs/sys/portal/hisinoneStartPage.faces"
+FLOW_URL = "https://digstu.hhu.de/qisserver/pages/startFlow.xhtml?_flowId=searchApplicants-flow&navigationPosition=hisinoneapp,applicationEditorGeneratedJSFDtos&recordRequest=true"
 
 MODULE_MAP_CSV = os.path.join(RES_DIR, "mathemodule_info.csv")
 OUTPUT_CSV = os.path.join(OUTPUT_DIR, "bewerber_evaluierung_ai.csv")
 
-DOM_ECTS_MAP = {
+# read-only views: prevents accidental mutation by consumers
+DOM_ECTS_MAP = MappingProxyType({
     "mathematik": "Mathematik",
     "mathe": "Mathematik"
 
 
-}
+})
+DOM_ECTS_KEYS = frozenset(DOM_ECTS_MAP)
+
+# one multi-pattern regex pass instead of iterating DOM_ECTS_MAP per row;
+# longest keys first so the most specific match wins
+_DOM_PATTERN = re.compile(
+    "|".join(sorted(map(re.escape, DOM_ECTS_MAP), key=len, reverse=True)))
+
+
+def classify_module(name_lower):
+    m = _DOM_PATTERN.search(name_lower)
+    return DOM_ECTS_MAP[m.group(0)] if m else None
 
 
 REQ_NOTE_MAX = 2.4
-REQUIREMENTS = {
+# DPI for the quick grade-note scan; transcripts keep the OCR default
+GRADE_OCR_DPI = 150
+REQUIREMENTS = MappingProxyType({
     "Mathematik": 30.0
-}
+})
 WHITELIST_UNIS = os.path.join(RES_DIR, "whitelist_unis_ai.csv")
 
 
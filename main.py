@@ -1,8 +1,8 @@
-import time
 import json
 import os
 import sys
 import argparse
+import functools
 import importlib
 import sys
 import logging
@@ -12,26 +12,67 @@ logging.basicConfig(
     datefmt="%H:%M:%S"
 )
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from utils.browserautomation import BrowserAutomation
-from phases.filterphase_evaluierung import run_filterphase_evaluierung
-
-
+# selenium and the phase module are imported lazily inside the functions
+# that need them, so config errors and -h don't pay their import cost
 
+# fallbacks when the loaded config does not define its own URLs
+# (configs may target different hosts, e.g. test02 vs prod)
 LOGIN_URL = "https://digstu.hhu.de/qisserver/pages/cs/sys/portal/hisinoneStartPage.faces"
 FLOW_URL = "https://digstu.hhu.de/qisserver/pages/startFlow.xhtml?_flowId=searchApplicants-flow&navigationPosition=hisinoneapp,applicationEditorGeneratedJSFDtos&recordRequest=true"
 
 
+DEBUGGER_ADDRESS = "127.0.0.1:9222"
+
+REQUIRED_CONFIG_ATTRS = (
+    "DOWNLOAD_DIR", "REQUIREMENTS", "DOM_ECTS_MAP",
+    "WHITELIST_UNIS", "MODULE_MAP_CSV", "OUTPUT_CSV", "REQ_NOTE_MAX",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def load_config(name):
+    """Import config.<name> once and validate all required attributes
+
+    in a single sweep (one clear error instead of failing attribute by
+    attribute)."""
+    mod = importlib.import_module(f"config.{name}")
+    missing = [a for a in REQUIRED_CONFIG_ATTRS if not hasattr(mod, a)]
+    if missing:
+        raise SystemExit(f"config '{name}.py' missing: {missing}")
+    return mod
+
+
 def create_chrome_options(download_dir):
+    from selenium.webdriver.chrome.options import Options
+
     chrome_options = Options()
 
     chrome_options.add_argument("--ignore-certificate-errors")
     chrome_options.add_argument("--enable-javascript")
+    # persistent profile: keeps DNS/HSTS/cookies warm between runs and lets
+    # a later run attach to this Chrome instead of cold-starting a new one
+    profile_dir = os.path.join(
+        os.path.dirname(__file__), "ressources", "chrome_profile")
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    chrome_options.add_argument(
+        f"--remote-debugging-port={DEBUGGER_ADDRESS.split(':')[1]}")
 #    chrome_options.add_argument("--window-size=1400,900")
     chrome_options.add_argument("--headless") # prevents focus stealing, can work alongside ;-)
+    # scraping workload: no GPU, no extensions, no images
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    # return from get() once the DOM is interactive instead of waiting for
+    # every late sub-resource (tracking pixels etc.)
+    chrome_options.page_load_strategy = "eager"
+    # keep Chrome from writing (and fsyncing) devtools logs per command
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_argument("--silent")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
 
     chrome_options.add_experimental_option("prefs", {
         "credentials_enable_service": False,
@@ -39,28 +80,78 @@ def create_chrome_options(download_dir):
         "download.default_directory": download_dir,
         "download.prompt_for_download": False,
         "download.directory_upgrade": True,
-        "plugins.always_open_pdf_externally": True
+        "plugins.always_open_pdf_externally": True,
+        # images are most of the page bytes and we never look at them
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
     })
 
     return chrome_options
 
 
-def perform_login(bot, username, password):
+def probe_plain_login(login_url, timeout=5):
+    """Check whether the login page could be driven without a browser.
+
+    HISinOne is JSF-based (faces.js, ViewState round-trips), so in practice
+    this returns False and we keep Selenium; the probe is cheap and tells us
+    early if the target ever becomes a plain HTML form.
+    """
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(login_url, timeout=timeout) as resp:
+            html = resp.read(200000).decode("utf-8", errors="replace")
+    except Exception as e:
+        logging.debug(f"Login probe failed ({e}), assuming JS-only backend")
+        return False
+
+    has_form = "<form" in html and 'type="password"' in html
+    js_heavy = "faces.js" in html or "javax.faces" in html or "ViewState" in html
+    return has_form and not js_heavy
+
+
+def perform_login(bot, username, password, timeout=15):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import (
+        NoSuchElementException,
+        StaleElementReferenceException,
+    )
+
     logging.info("Performing Login...")
 
+    if not bot.browser.find_elements(By.ID, "asdf"):
+        # no login form: session cookie from the persistent profile is
+        # still valid, nothing to do
+        logging.info("Already logged in (no login form), skipping login")
+        return True
+
     try:
-        wait = WebDriverWait(bot.browser, 2)
-        user_field = wait.until(
-            EC.presence_of_element_located((By.ID, "asdf")))
-        pass_field = wait.until(
-            EC.presence_of_element_located((By.ID, "fdsa")))
-        login_btn = wait.until(
-            EC.element_to_be_clickable((By.ID, "loginForm:login")))
-
-        user_field.clear()
-        user_field.send_keys(username)
-        pass_field.clear()
-        pass_field.send_keys(password)
+        # default 500ms polling adds avoidable tail latency for elements
+        # that usually appear in <200ms
+        wait = WebDriverWait(
+            bot.browser, timeout, poll_frequency=0.1,
+            ignored_exceptions=(
+                StaleElementReferenceException, NoSuchElementException),
+        )
+        # one JS poll for all three elements instead of three separate
+        # polled waits (one driver round-trip per poll instead of three)
+        wait.until(lambda d: d.execute_script(
+            "return !!(document.getElementById('asdf')"
+            " && document.getElementById('fdsa')"
+            " && document.getElementById('loginForm:login'));"))
+        user_field = bot.browser.find_element(By.ID, "asdf")
+        pass_field = bot.browser.find_element(By.ID, "fdsa")
+        login_btn = bot.browser.find_element(By.ID, "loginForm:login")
+
+        # set both values in one JS call instead of per-character send_keys;
+        # the input event keeps the JSF form aware of the change
+        bot.browser.execute_script(
+            "arguments[0].value = arguments[2];"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles:true}));"
+            "arguments[1].value = arguments[3];"
+            "arguments[1].dispatchEvent(new Event('input', {bubbles:true}));",
+            user_field, pass_field, username, password)
         login_btn.click()
 
         logging.debug("Clicked on login button")
@@ -70,7 +161,7 @@ def perform_login(bot, username, password):
 
     try:
 
-        WebDriverWait(bot.browser, 2).until(
+        WebDriverWait(bot.browser, timeout, poll_frequency=0.1).until(
             lambda d: "startFlow" in d.current_url or "portal" in d.current_url
         )
         logging.info("Login succesfull plus redirect")
@@ -80,11 +171,39 @@ def perform_login(bot, username, password):
         return False
 
 
-def open_flow(bot):
+def wait_for_popup_gone(bot, timeout=7):
+    """Poll until the page settled and no login/cookie popup overlay is left.
+
+    Returns as soon as the popup is gone instead of sleeping a fixed time.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(bot.browser, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(
+                "return document.readyState === 'complete'"
+                " && document.querySelectorAll("
+                "\"div[id*='popup'], div.ui-dialog, div[class*='overlay']\""
+                ").length === 0"
+            )
+        )
+        logging.debug("Popup gone / page settled.")
+    except Exception:
+        logging.warning("Popup not gone after timeout, continuing anyway")
+
+
+def open_flow(bot, flow_url, timeout=2):
+    from selenium.webdriver.support.ui import WebDriverWait
+
     logging.info("Opening page")
-    bot.open_url(FLOW_URL)
-    WebDriverWait(bot.browser, 2).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
+    # login redirect may already have landed on the flow page - in that
+    # case skip the re-navigation (saves a full page load)
+    if "searchApplicants-flow" not in bot.browser.current_url:
+        bot.open_url(flow_url)
+    # readyState check is a cheap JS eval, poll it tightly
+    WebDriverWait(bot.browser, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script("return document.readyState")
+        in ("interactive", "complete")
     )
     logging.info("Found site")
 
@@ -98,54 +217,77 @@ def main():
         help="Name der zu ladenden Konfigurationsdatei ",
         required=True
     )
+    parser.add_argument(
+        "--login-timeout", type=float, default=15,
+        help="Timeout (s) fuer Login-Formular und Redirect"
+    )
+    parser.add_argument(
+        "--wait-timeout", type=float, default=2,
+        help="Timeout (s) fuer Seiten-Readiness nach Navigation"
+    )
     args = parser.parse_args()
 
     config_name = args.config
     try:
-
-        config_module = importlib.import_module(f"config.{config_name}")
+        config_module = load_config(config_name)
         logging.info(f"Konfiguration '{config_name}' erfolgreich geladen")
-
-        try:
-            download_dir = config_module.DOWNLOAD_DIR
-            os.makedirs(download_dir, exist_ok=True)
-            logging.info(f"Download secured under : {download_dir}")
-        except AttributeError:
-            logging.critical(f"'DOWNLOAD_DIR' not found '{config_name}.py' ")
-            sys.exit(1)
-
     except ImportError:
         logging.critical(
             f"config '{config_name}.py' not found ")
         sys.exit(1)
 
-    args = parser.parse_args()
+    download_dir = config_module.DOWNLOAD_DIR
+    os.makedirs(download_dir, exist_ok=True)
+    logging.info(f"Download secured under : {download_dir}")
+
     credentials_path = os.path.join(
         os.path.dirname(__file__), "credentials.json")
-    with open("credentials.json", "r", encoding="utf-8-sig") as f:
-        credentials = json.load(f)
 
-    username = credentials["username"]
-    password = credentials["password"]
+    def _read_credentials():
+        with open(credentials_path, "rb") as f:
+            # read bytes and strip a possible BOM instead of utf-8-sig decoding
+            return json.loads(f.read().lstrip(b"\xef\xbb\xbf"))
 
     ### START BROWSER
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.browserautomation import BrowserAutomation
+    from phases.filterphase_evaluierung import run_filterphase_evaluierung
+
+    login_url = getattr(config_module, "LOGIN_URL", LOGIN_URL)
+    flow_url = getattr(config_module, "FLOW_URL", FLOW_URL)
+
+    if probe_plain_login(login_url):
+        # Not reachable today (JSF backend), but would allow a requests-based
+        # login without Chrome if the server ever serves a plain form.
+        logging.info("Login page looks like a plain HTML form (no JS needed)")
     logging.debug("Opening browser...")
     chrome_options = create_chrome_options(download_dir)
-    bot = BrowserAutomation(options=chrome_options)
+    # Chrome startup is the long pole (seconds) - read credentials while
+    # the browser boots instead of before it
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        bot_fut = ex.submit(
+            BrowserAutomation,
+            options=chrome_options, debugger_address=DEBUGGER_ADDRESS)
+        creds_fut = ex.submit(_read_credentials)
+        credentials = creds_fut.result()
+        bot = bot_fut.result()
+
+    username = credentials["username"]
+    password = credentials["password"]
 
     logging.debug("Opening URL...")
-    bot.open_url(LOGIN_URL)
+    bot.open_url(login_url)
     logging.debug("Logging in...")
 
-    perform_login(bot, username, password)
+    perform_login(bot, username, password, timeout=args.login_timeout)
 
-    logging.debug("Waiting for popup (0.1 second)...")
-    time.sleep(0.1)
+    logging.debug("Waiting for popup...")
+    wait_for_popup_gone(bot)
 
     logging.debug("Open flow...")
-    open_flow(bot)
+    open_flow(bot, flow_url, timeout=args.wait_timeout)
     logging.debug("Filterphase Evaluierung...")
-    run_filterphase_evaluierung(bot, FLOW_URL, config_module)
+    run_filterphase_evaluierung(bot, flow_url, config_module)
 
     logging.info("Done.")
 #    input("ENTER = finish ")# why not just terminate the program at the end? makes profiling easier.
@@ -2,10 +2,18 @@ import os
 import re
 import time
 import csv
+import atexit
 import tqdm
 import logging
 import asyncio
-from functools import partial
+import numpy as np
+try:
+    import pandas as pd  # C-speed CSV parse for the module mapping
+except ImportError:
+    pd = None
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -17,16 +25,16 @@ from utils.language_certificates import (
     evaluate_language_status_bwl,
     evaluate_language_status_ai,
 )
+from utils.ocr_cache import get_or_ocr
 from utils.ocr_ects import (
+    _compute_file_hash,
     ensure_ocr_available,
     extract_ects_hybrid_async,
     extract_ocr_note,
+    get_ocr_pool,
     ocr_text_from_pdf,
 )
-from utils.claimed_dom_extract import (
-    extract_claimed_from_dom,
-    get_university_from_dom,
-)
+from utils.claimed_dom_extract import extract_claimed_from_dom
 from utils.hisinone_downloader import download_pdfs_for_applicant
 from utils.grading_systems import verify_grade
 
@@ -36,8 +44,54 @@ ROW_LOCATOR = (
     "//table//tr[.//td and not(contains(@style,'display:none'))]",
 )
 
+# per-applicant locators, defined once instead of rebuilt in every call
+APPLICANT_LINK_XPATH = (By.XPATH, ".//a[contains(@href,'applicationEditor-flow')]")
+ROW_ACTION_BTN_XPATH = (By.XPATH, ".//button[contains(@id,'tableRowAction')]")
+
 BEWERBERNUMMER = re.compile(r"\b(\d{5,})\b")
 
+# the grade is a short prominent number - a quick low-DPI scan finds it in
+# almost all cases; only the fallback re-render uses a higher DPI
+GRADE_SCAN_DPI = 150
+GRADE_FALLBACK_DPI = 200
+
+GRADE_KEYWORDS = ("zeugnis", "certificate", "urkunde", "diploma")
+# one C-level scan per filename instead of a Python any() over keywords
+GRADE_NAME_RE = re.compile("|".join(GRADE_KEYWORDS))
+
+# filename heuristic for language certificates, used on the whitelist fast
+# path where the per-PDF classification is skipped entirely
+LANG_KEYWORDS = ("toefl", "ielts", "sprach", "language", "english",
+                 "goethe", "telc", "dsh")
+LANG_NAME_RE = re.compile("|".join(LANG_KEYWORDS))
+
+# shared pool for per-PDF OCR fan-out (created once, not per applicant);
+# pytesseract shells out to tesseract, so threads genuinely overlap here
+_OCR_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
+# how many applicants may be in background analysis at once; bounds CPU
+# use while the main loop keeps navigating/downloading ahead
+MAX_CONCURRENT_OCR = 3
+
+# cross-applicant dedupe of the heavy hybrid ECTS extraction: different
+# applicants regularly upload byte-identical transcripts/module catalogues,
+# so results are memoized per content hash for the lifetime of the process
+# (grade OCR and classification already dedupe via their disk caches)
+_ECTS_RESULT_CACHE = {}
+
+
+@dataclass(frozen=True, slots=True)
+class EvalCtx:
+    """Per-run invariants, resolved once from config instead of getattr per
+    applicant. Frozen + slots: attribute reads are C-slot lookups and the
+    instance is picklable, so it travels into the OCR process pool as-is."""
+    program: str
+    categories: tuple
+    requirements_items: tuple
+    req_note_max: float
+    grade_dpi: int
+    early_reject: bool
+
 def init_paths_from_config(config):
     base_dir = os.path.dirname(__file__)
     ressources_dir = os.path.abspath(
@@ -78,10 +132,15 @@ def init_paths_from_config(config):
 
 
 def load_whitelist(csv_path):
-    whitelist = set()
+    # memoized per (path, mtime): re-parses only when the file changed
     if not csv_path or not os.path.exists(csv_path):
         logging.warn("Keine Whitelist-Datei angegeben.")
-        return whitelist
+        return frozenset()
+    return _load_whitelist_cached(csv_path, os.path.getmtime(csv_path))
+
+
+@lru_cache(maxsize=None)
+def _load_whitelist_cached(csv_path, mtime):
     with open(csv_path, newline="", encoding="utf-8") as f:
         reader = csv.reader(f)
         next(reader, None)
@@ -91,50 +150,98 @@ def load_whitelist(csv_path):
                                       if row)
                      if stripped}
     logging.info(f"Whitelist geladen: {len(whitelist)} Einträge.")
-    return whitelist
+    return frozenset(whitelist)
 
 
 def load_module_mapping(csv_path):
-    mapping = {}
+    # memoized per (path, mtime): re-parses only when the file changed
     if not os.path.exists(csv_path):
         logging.warn(f"Mapping  fehlt: {csv_path}")
-        return mapping
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            key = r.get("module") or r.get("modul")
-            cat = r.get("category") or r.get("Kategorie")
-            if key and cat:
-                mapping[key.strip().lower()] = cat.strip()
+        return {}
+    return _load_module_mapping_cached(csv_path, os.path.getmtime(csv_path))
+
+
+@lru_cache(maxsize=None)
+def _load_module_mapping_cached(csv_path, mtime):
+    if pd is not None:
+        # vectorized parse + strip/lower instead of a per-row DictReader
+        # loop; for mappings with thousands of modules the Python dict
+        # construction per row dominated startup
+        df = pd.read_csv(
+            csv_path, dtype=str,
+            usecols=lambda c: c.strip().lower()
+            in ("module", "modul", "category", "kategorie"))
+        df.columns = [c.strip().lower() for c in df.columns]
+        key_col = "module" if "module" in df.columns else "modul"
+        cat_col = "category" if "category" in df.columns else "kategorie"
+        df = df.dropna(subset=[key_col, cat_col])
+        mapping = dict(zip(df[key_col].str.strip().str.lower(),
+                           df[cat_col].str.strip()))
+    else:
+        mapping = {}
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for r in reader:
+                key = r.get("module") or r.get("modul")
+                cat = r.get("category") or r.get("Kategorie")
+                if key and cat:
+                    mapping[key.strip().lower()] = cat.strip()
     logging.info(f"Modul-Mapping geladen: {len(mapping)} eintraege.")
     return dict(
         sorted(mapping.items(), key=lambda item: len(item[0]), reverse=True)
     )
 
 
-def is_candidate_row(row): # XXX deprecated, not necessary, bad code anyways.
-    try:
-        cells = row.find_elements(By.TAG_NAME, "td")
-        if not cells or len(cells) < 3:
-            return False
-        text = " ".join(c.text.strip().lower() for c in cells)
-        return ("bewerbung" in text) or BEWERBERNUMMER.search(text)
-    except Exception:
-        return False
-
-
+# one wire call that enumerates the whole result table: per row we get the
+# index (same semantics as ROW_LOCATOR), the column3 text and - if present -
+# the detail link href / row action button id, so the main loop never has to
+# re-walk the table per applicant
+BULK_ROW_JS = """
+const xp = "//table//tr[.//td and not(contains(@style,'display:none'))]";
+const snap = document.evaluate(xp, document, null,
+    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 1; i < snap.snapshotLength; i++) {  // row 0 is the header
+    const r = snap.snapshotItem(i);
+    const a = r.querySelector("a[href*='applicationEditor-flow']");
+    const b = r.querySelector("button[id*='tableRowAction']");
+    const td = r.querySelector("td[class*='column3'], td[class*='column 3']");
+    const text = (td ? td.textContent : r.textContent) || "";
+    // candidate predicate lives here too: applicant number or 'Bewerbung'
+    // in the row, so Python never has to post-filter
+    if (!/\\d{5,}/.test(text) && !/bewerbung/i.test(text)) continue;
+    out.push({
+        index: i,
+        text: text,
+        href: a ? a.href : null,
+        btnId: b ? b.id : null
+    });
+}
+return out;
+"""
+
+# one round-trip per row instead of 1 + N(.text) calls
 def get_applicant_number_from_detail_page(browser):
     try:
-        el = WebDriverWait(browser, 1).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//span[contains(@id, 'applicantDataSummary_number')]"
-                    " | //span[contains(text(), 'Bewerbernummer')]/following-sibling::span"
-                    " | //span[contains(text(), 'Bewerbungsnummer')]/following-sibling::span",
+        # CSS first: dispatched to native querySelectorAll, much cheaper
+        # than the 3-alternative XPath which stays as a rare fallback
+        try:
+            el = WebDriverWait(browser, 1).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR,
+                     "span[id*='applicantDataSummary_number']")
+                )
+            )
+        except Exception:
+            el = WebDriverWait(browser, 1).until(
+                EC.presence_of_element_located(
+                    (
+                        By.XPATH,
+                        "//span[contains(text(), 'Bewerbernummer')]/following-sibling::span"
+                        " | //span[contains(text(), 'Bewerbungsnummer')]/following-sibling::span",
+                    )
                 )
             )
-        )
         txt = el.text.strip()
         m = BEWERBERNUMMER.search(txt)
         if m:
@@ -144,18 +251,33 @@ def get_applicant_number_from_detail_page(browser):
         return f"unknown_{int(time.time())}"
 
 
+@lru_cache(maxsize=4)
+def _whitelist_pattern(whitelist_key):
+    # one compiled alternation instead of a per-applicant linear scan over
+    # the whole whitelist; longest names first so the most specific wins
+    return re.compile("|".join(
+        sorted(map(re.escape, whitelist_key), key=len, reverse=True)))
+
+
 def check_university_whitelist(uni_text: str, whitelist_set):
     if not whitelist_set or not uni_text:
         return False, None
 
-    low = uni_text.lower()
-    for uni_name in whitelist_set:
-        if uni_name in low:
-            return True, uni_name
+    m = _whitelist_pattern(frozenset(whitelist_set)).search(uni_text.lower())
+    if m:
+        return True, m.group(0)
     return False, None
 
 
-def evaluate_requirements_ects(ects_data, matched_modules, unrecognized, config):
+@lru_cache(maxsize=4)
+def _req_arrays(req_items):
+    # built once per distinct REQUIREMENTS mapping
+    cats = tuple(c for c, _ in req_items)
+    vals = np.array([v for _, v in req_items], dtype=np.float64)
+    return cats, vals
+
+
+def evaluate_requirements_ects(ects_data, matched_modules, unrecognized, ctx):
     """
     Only checks ECTS requirements (grade is checked separately).
 
@@ -163,19 +285,25 @@ def evaluate_requirements_ects(ects_data, matched_modules, unrecognized, config)
     """
     reasons = []
     ok = True
-    requirements_ects = getattr(config, "REQUIREMENTS", {})
 
-    if not requirements_ects:
+    if not ctx.requirements_items:
         reasons.append("No ECTS requirements defined in config.")
         ok = False
     else:
-        for category, req_value in requirements_ects.items():
-            ocr_value = float(ects_data.get(category, 0.0))
-            if ocr_value < req_value:
+        # vectorized: one array comparison instead of a Python dict loop;
+        # reasons are only formatted for the failing indices
+        cats, req_vals = _req_arrays(ctx.requirements_items)
+        actuals = np.fromiter(
+            (float(ects_data.get(c, 0.0)) for c in cats),
+            dtype=np.float64, count=len(cats),
+        )
+        fails = actuals < req_vals
+        if fails.any():
+            ok = False
+            for i in np.flatnonzero(fails):
                 reasons.append(
-                    f"{category}: not enough ECTS ({ocr_value} < {req_value})"
+                    f"{cats[i]}: not enough ECTS ({actuals[i]} < {req_vals[i]})"
                 )
-                ok = False
 
     if unrecognized:
         reasons.append(f"{len(unrecognized)} unrecognized module line(s)")
@@ -186,8 +314,30 @@ def evaluate_requirements_ects(ects_data, matched_modules, unrecognized, config)
     )
     return status, details
 
+# persistent event loop for the phase: asyncio.run would create and tear
+# down a fresh loop (and its default executor) per invocation, discarding
+# warmed state when the phase runs several times in a pipeline. The OCR
+# process pool (get_ocr_pool) is already a long-lived singleton; this keeps
+# the loop side symmetric.
+_PHASE_LOOP = None
+
+
+def _get_phase_loop():
+    global _PHASE_LOOP
+    if _PHASE_LOOP is None or _PHASE_LOOP.is_closed():
+        _PHASE_LOOP = asyncio.new_event_loop()
+    return _PHASE_LOOP
+
+
+@atexit.register
+def _close_phase_loop():
+    if _PHASE_LOOP is not None and not _PHASE_LOOP.is_closed():
+        _PHASE_LOOP.close()
+
+
 def run_filterphase_evaluierung(bot, flow_url, config):
-    asyncio.run(_run_filterphase_evaluierung_async(bot, flow_url, config))
+    _get_phase_loop().run_until_complete(
+        _run_filterphase_evaluierung_async(bot, flow_url, config))
 
 async def _run_filterphase_evaluierung_async(bot, flow_url, config):
     logging.info("Starte Evaluierung...")
@@ -204,86 +354,138 @@ async def _run_filterphase_evaluierung_async(bot, flow_url, config):
     module_map = load_module_mapping(paths["module_map_csv"])
     whitelist_set = load_whitelist(getattr(config, "WHITELIST_UNIS", None))
     categories = list(getattr(config, "REQUIREMENTS", {}).keys())
+    # invariant per run - resolved once here instead of per applicant
+    req_note_max = getattr(config, "REQ_NOTE_MAX", 2.4)
+    grade_dpi = getattr(config, "GRADE_OCR_DPI", GRADE_SCAN_DPI)
 
-    # 2. Initialize CSV
-    _init_csv_file(paths["output_csv"], categories)
+    # 2. Initialize CSV (handle stays open for the whole run; flushed in
+    # batches of _CsvSink.FLUSH_EVERY rows)
+    csv_writer = _CsvSink(paths["output_csv"], categories)
+    csv_lock = asyncio.Lock()
 
     # 3. Apply UI Filters & Search
     if not _apply_search_filters(bot):
+        csv_writer.close()
         return
-    
+
     if not _trigger_search_and_wait(bot):
+        csv_writer.close()
         return
 
-    # 4. Identify Candidate Indices
+    # 4. Identify Candidates (one JS call for the whole table)
     try:
-        rows_initial = bot.browser.find_elements(*ROW_LOCATOR)
         logging.debug("Identifying candidates...")
-        candidate_indices = [
-            idx for idx, r in enumerate(rows_initial)
-            if idx > 0 # and is_candidate_row(r) # XXX It seems is_candidate_row is always True for our input, the ROW_LOCATOR works.
-        ]
-        total = len(candidate_indices)
+        # header skip + candidate predicate already applied inside the JS
+        candidate_items = bot.browser.execute_script(BULK_ROW_JS)
+        total = len(candidate_items)
         logging.info(f"{total} Zeilen erkannt")
-        logging.debug(f"Indices: {candidate_indices})")
+        logging.debug(f"Indices: {[it['index'] for it in candidate_items]})")
     except Exception as count_e:
         logging.error(f"Konnte Zeilen nicht finden {count_e}")
+        csv_writer.close()
         return
 
     if total == 0:
         logging.info("Keine Bewerber gefunden.")
+        csv_writer.close()
         return
 
     main_window_handle = bot.browser.current_window_handle
-    
+
+    # Warm detail tab: opened once here and navigated per applicant.
+    # Chrome tab creation/teardown costs hundreds of ms (renderer spawn and
+    # teardown), so one reused tab beats an open+close per applicant - and
+    # the results table in the main window is never navigated away from.
+    detail_handle = None
+    try:
+        bot.browser.switch_to.new_window("tab")
+        detail_handle = bot.browser.current_window_handle
+        bot.browser.switch_to.window(main_window_handle)
+    except Exception as e:
+        logging.debug(f"Kein Detail-Tab ({e}), navigiere im Hauptfenster")
+
     # Determine Program Type
     program = "ai" if "mathemodule" in paths["module_map_csv"].lower() else "bwl"
 
+    # all per-run invariants in one frozen bundle (see EvalCtx)
+    ctx = EvalCtx(
+        program=program,
+        categories=tuple(categories),
+        requirements_items=tuple(getattr(config, "REQUIREMENTS", {}).items()),
+        req_note_max=req_note_max,
+        grade_dpi=grade_dpi,
+        early_reject=getattr(config, "EARLY_REJECT", True),
+    )
+
     # 5. Main Processing Loop (Iterate over Indices)
     pending_tasks = set()
-    # XXX  again this OCR/multiprocessing config should be centralized :-/
-    MAX_CONCURRENT_OCR = 3  # Prevent overloading the CPU if browser is too fast
+    # semaphore-bounded scheduling: the loop blocks here only when all OCR
+    # slots are busy, instead of polling pending tasks with timeouts
+    ocr_sem = asyncio.Semaphore(MAX_CONCURRENT_OCR)
 
-    progressbar = tqdm.tqdm(candidate_indices, desc="Processing", unit="app")
-    
-    for loop_index, target_row_index in enumerate(progressbar):
-        
-        # A. Clean up finished tasks
-        if pending_tasks:
-            done, pending_tasks = await asyncio.wait(pending_tasks, timeout=0.01, return_when=asyncio.FIRST_COMPLETED)
-        
-        # Flow Control: If we have too many OCRs running, wait for one to finish
-        if len(pending_tasks) >= MAX_CONCURRENT_OCR:
-            done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
+    progressbar = tqdm.tqdm(candidate_items, desc="Processing", unit="app")
+
+    # all Selenium calls inside the loop go through this single-thread
+    # executor: the browser stays single-threaded, but awaiting it lets the
+    # event loop keep scheduling finished analysis tasks (CSV writes etc.)
+    # instead of stalling behind navigation/download
+    loop = asyncio.get_running_loop()
+    browser_ex = ThreadPoolExecutor(max_workers=1)
+
+    for loop_index, row_item in enumerate(progressbar):
+
+        # A. Flow Control: wait for a free OCR slot (backpressure)
+        await ocr_sem.acquire()
 
         # B. Step 1: Sync Browser Work (Download & Extract)
-        res, pdfs = _step1_scrape_sync(
-            bot, loop_index, target_row_index, main_window_handle, paths, categories, config
-        )
+        res, pdfs = await loop.run_in_executor(browser_ex, partial(
+            _step1_scrape_sync,
+            bot, loop_index, row_item, main_window_handle, detail_handle,
+            paths, categories, config
+        ))
 
-        if not res: continue # Skip if navigation failed
+        if not res:
+            ocr_sem.release()
+            continue # Skip if navigation failed
 
         current_app = res.get("applicant_num", "Unknown")
         progressbar.set_postfix(app=f"{current_app}")
 
+        is_non_eu = await loop.run_in_executor(
+            browser_ex, _check_non_eu_status, bot)
+
         # C. Step 2: Schedule Async Analysis
         # This returns immediately, allowing the loop to continue to the next applicant!
         task = asyncio.create_task(
             _step2_analyze_async(
-                pdfs, program, _check_non_eu_status(bot), 
-                module_map, whitelist_set, categories, res, config, paths
+                pdfs, is_non_eu, module_map, whitelist_set, res, ctx,
+                csv_writer, csv_lock
             )
         )
         pending_tasks.add(task)
-        
-        # Cleanup browser tab for the next iteration (must be done on main thread)
-        _close_tab_and_return(bot, main_window_handle)
+        task.add_done_callback(pending_tasks.discard)
+        task.add_done_callback(lambda _t: ocr_sem.release())
+
+        # Back to the results window for the next iteration (same browser
+        # thread); the detail tab stays warm
+        await loop.run_in_executor(
+            browser_ex, _return_to_results, bot, main_window_handle,
+            detail_handle)
+
+    if detail_handle:
+        await loop.run_in_executor(
+            browser_ex, _close_detail_tab, bot, main_window_handle,
+            detail_handle)
+
+    browser_ex.shutdown(wait=True)
 
     # 6. Wait for remaining tasks after loop finishes
     if pending_tasks:
         logging.info(f"Waiting for {len(pending_tasks)} remaining background tasks...")
         await asyncio.wait(pending_tasks)
 
+    csv_writer.close()
+
     total_time = time.time() - eval_start
     logging.debug(f"Total evaluation time: {total_time:.2f} seconds")
     logging.debug(f"abgeschlossen. CSV: {paths['output_csv']}")
@@ -293,10 +495,12 @@ async def _run_filterphase_evaluierung_async(bot, flow_url, config):
 #                               HELPER FUNCTIONS
 # ==============================================================================
 
-def _step1_scrape_sync(bot, loop_index, target_row_index, main_window_handle, paths, categories, config):
+def _step1_scrape_sync(bot, loop_index, row_item, main_window_handle,
+                       detail_handle, paths, categories, config):
     """
     Performs all Browser interactions. Returns (result_dict, pdf_paths).
-    Processes the applicant at the specific physical DOM index `target_row_index`.
+    Processes the applicant described by `row_item` (index/href/btnId from
+    the one-shot BULK_ROW_JS table scan).
     """
     
     # Default Result Structure
@@ -324,14 +528,16 @@ def _step1_scrape_sync(bot, loop_index, target_row_index, main_window_handle, pa
     }
 
     # 1. Navigation
-    if not _navigate_to_applicant_detail_by_index(bot, target_row_index, main_window_handle, res):
+    if not _navigate_to_applicant_detail(bot, row_item, main_window_handle,
+                                         detail_handle, res):
         return None, []
 
     # 2. Extract Metadata
     res["applicant_num"] = get_applicant_number_from_detail_page(bot.browser)
     _handle_application_buttons(bot)
+    # one DOM harvest call carries note, CP values, country and university
     res["claimed"] = extract_claimed_from_dom(bot.browser, config)
-    res["uni_name"] = get_university_from_dom(bot.browser)
+    res["uni_name"] = res["claimed"].get("uni_name", "")
     res["bachelor_country"] = res["claimed"].get("bachelor_country", "")
 
     # 3. Document Download
@@ -344,47 +550,59 @@ def _step1_scrape_sync(bot, loop_index, target_row_index, main_window_handle, pa
     
     return res, pdfs
 
-async def _step2_analyze_async(pdfs, program, is_non_eu, module_map, whitelist_set, categories, res, config, paths):
+async def _step2_analyze_async(pdfs, is_non_eu, module_map, whitelist_set,
+                               res, ctx, csv_writer, csv_lock):
     """
     Background Task: Performs heavy OCR and Logic without blocking the browser.
     """
     loop = asyncio.get_running_loop()
 
     try:
-        # A. Analyze Grades (Sync function wrapped in Executor to prevent blocking)
-        # We use 'None' as the executor to use the default ThreadPoolExecutor
-        await loop.run_in_executor(
-            None, 
-            partial(_analyze_grade_logic, pdfs, is_non_eu, res, config)
+        # stat each PDF exactly once; every size-based decision below works
+        # off this dict instead of re-issuing stat() syscalls
+        sizes = {p: os.path.getsize(p) for p in pdfs}
+
+        # one pass over the lowered basenames instead of three separate
+        # filter comprehensions (vpd test, grade-keyword test, non-vpd)
+        vpd_pdfs, grade_pdfs, non_vpd_pdfs = [], [], []
+        for p in pdfs:
+            name = os.path.basename(p).lower()
+            if "vpd" in name:
+                vpd_pdfs.append(p)
+            else:
+                non_vpd_pdfs.append(p)
+            if GRADE_NAME_RE.search(name):
+                grade_pdfs.append(p)
+
+        # A. Analyze Grades - in the shared OCR process pool: tesseract and
+        # the parsing run on their own cores instead of fighting the event
+        # loop's threads for the GIL
+        grade_updates, grade_details = await loop.run_in_executor(
+            get_ocr_pool(),
+            partial(_analyze_grade_logic, pdfs, vpd_pdfs, grade_pdfs,
+                    is_non_eu, res["claimed"].get("note"),
+                    res["bachelor_country"], ctx, sizes)
         )
-
-        # B. Analyze ECTS
-        # We inline the logic from _analyze_documents_and_ects here to make it async
-        non_vpd_pdfs = [p for p in pdfs if "vpd" not in os.path.basename(p).lower()]
-        best_transcript_path = None
-        lang_pdfs = []
-
-        if non_vpd_pdfs:
-            # classify_many is fast/light, can run sync or wrapped
-            class_result = classify_many(non_vpd_pdfs, program)
-            best_transcript_path, _ = class_result["best_transcript"]
-            
-            res["has_bachelor"] = bool(class_result["by_type"].get("degree_certificate"))
-            res["has_transcript"] = bool(class_result["by_type"].get("transcript") or best_transcript_path)
-            lang_pdfs = class_result["by_type"].get("language_certificate", [])
-            
-            for dtype, p_list in class_result["by_type"].items():
-                if dtype not in ("transcript", "degree_certificate", "language_certificate", "vpd"):
-                    res["other_docs"].extend([os.path.basename(p) for p in p_list])
-
-        # Language Status logic (Fast)
-        if program == "bwl":
-            lang_status = evaluate_language_status_bwl(lang_pdfs, res.get("bachelor_country_raw", ""))
-        else:
-            lang_status = evaluate_language_status_ai(lang_pdfs)
-        res["details_list"].append(f"Language status: {lang_status}")
-
-        # University Whitelist Check
+        res.update(grade_updates)
+        res["details_list"].extend(grade_details)
+
+        # Early reject: the final decision needs grade AND ECTS to pass, so
+        # once the grade failed, classification + transcript OCR cannot flip
+        # the outcome - skip them and only fill what the CSV row needs
+        if not res["note_ok"] and ctx.early_reject:
+            is_whitelisted, _ = check_university_whitelist(res["uni_name"], whitelist_set)
+            res["is_whitelisted"] = is_whitelisted
+            res["details_list"].append("Language status: skipped (grade fail)")
+            res["extraction_method"] = "Skipped (grade fail)"
+            res["status_final"] = "Not fulfilled"
+            async with csv_lock:
+                _write_result_to_csv(csv_writer, res, ctx.categories)
+            logging.debug(f"Early reject (grade) for {res['applicant_num']}")
+            return
+
+        # B. University Whitelist Check - decided BEFORE classification and
+        # transcript OCR: the whitelist branch works off the claimed values
+        # only, so all of that per-PDF work would be thrown away
         is_whitelisted, uni_match = check_university_whitelist(res["uni_name"], whitelist_set)
         res["is_whitelisted"] = is_whitelisted
         status_ects = "Not fulfilled"
@@ -392,22 +610,65 @@ async def _step2_analyze_async(pdfs, program, is_non_eu, module_map, whitelist_s
         if is_whitelisted:
             logging.info(f"Whitelisted match: {uni_match}")
             res["extraction_method"] = "Whitelist"
-            status_ects, _ = evaluate_requirements_ects(res["claimed"], [], [], config)
+            # no classification ran, so the language certificate is only
+            # identified by filename - flagged as unverified in the details
+            lang_hits = [os.path.basename(p) for p in pdfs
+                         if LANG_NAME_RE.search(os.path.basename(p).lower())]
+            if lang_hits:
+                res["details_list"].append(
+                    f"Language status: available (filename: {lang_hits[0]}, not verified)")
+            else:
+                res["details_list"].append("Language status: unclear (whitelist fast path)")
+            status_ects, _ = evaluate_requirements_ects(res["claimed"], [], [], ctx)
             res["details_list"].append(f"ECTS (claimed) status: {status_ects}")
         else:
+            # C. Analyze ECTS
+            # We inline the logic from _analyze_documents_and_ects here to make it async
+            best_transcript_path = None
+            lang_pdfs = []
+
+            if non_vpd_pdfs:
+                # classify_many is fast/light, can run sync or wrapped
+                class_result = classify_many(non_vpd_pdfs, ctx.program)
+                best_transcript_path, _ = class_result["best_transcript"]
+
+                res["has_bachelor"] = bool(class_result["by_type"].get("degree_certificate"))
+                res["has_transcript"] = bool(class_result["by_type"].get("transcript") or best_transcript_path)
+                lang_pdfs = class_result["by_type"].get("language_certificate", [])
+
+                for dtype, p_list in class_result["by_type"].items():
+                    if dtype not in ("transcript", "degree_certificate", "language_certificate", "vpd"):
+                        res["other_docs"].extend([os.path.basename(p) for p in p_list])
+
+            # Language Status logic (Fast)
+            if ctx.program == "bwl":
+                lang_status = evaluate_language_status_bwl(lang_pdfs, res.get("bachelor_country_raw", ""))
+            else:
+                lang_status = evaluate_language_status_ai(lang_pdfs)
+            res["details_list"].append(f"Language status: {lang_status}")
+
             if not non_vpd_pdfs:
                 res["details_list"].append("Only VPD found, no transcript.")
             else:
-                main_pdf = best_transcript_path if best_transcript_path else max(non_vpd_pdfs, key=os.path.getsize)
-                
-                sums, matched, unrec, method = await extract_ects_hybrid_async(main_pdf, module_map, categories)
-                
+                main_pdf = best_transcript_path if best_transcript_path else max(non_vpd_pdfs, key=sizes.get)
+
+                main_hash = _compute_file_hash(main_pdf)
+                cached = _ECTS_RESULT_CACHE.get(main_hash)
+                if cached is not None:
+                    logging.debug(f"ECTS-Ergebnis aus Hash-Cache für {os.path.basename(main_pdf)}")
+                    sums, matched, unrec, method = cached
+                else:
+                    sums, matched, unrec, method = await extract_ects_hybrid_async(
+                        main_pdf, module_map, ctx.categories)
+                    if not method.startswith("FAILED"):
+                        _ECTS_RESULT_CACHE[main_hash] = (sums, matched, unrec, method)
+
                 res["saved_pdf_counts"] = sums
                 res["matched_modules"] = matched
                 res["unrecognized_lines"] = unrec
                 res["extraction_method"] = method
-                
-                status_ects, _ = evaluate_requirements_ects(sums, matched, unrec, config)
+
+                status_ects, _ = evaluate_requirements_ects(sums, matched, unrec, ctx)
                 res["details_list"].append(f"ECTS (OCR) status: {status_ects}")
 
         # Final Decision Logic
@@ -419,75 +680,84 @@ async def _step2_analyze_async(pdfs, program, is_non_eu, module_map, whitelist_s
 
         # C. Write Result to CSV immediately upon completion
         # We calculate duration relative to when the analysis *finished*
-        _write_result_to_csv(paths["output_csv"], res, categories)
+        async with csv_lock:
+            _write_result_to_csv(csv_writer, res, ctx.categories)
         logging.debug(f"Finished Analysis for {res['applicant_num']}")
         
     except Exception as e:
         logging.error(f"Async Analysis Error {res['applicant_num']}: {e}")
         
 
-def _navigate_to_applicant_detail_by_index(bot, target_index, main_window_handle, res):
+def _navigate_to_applicant_detail(bot, row_item, main_window_handle,
+                                  detail_handle, res):
     """
-    Refetches the table (to avoid StaleElement) and clicks the row at `target_index`.
+    Opens the applicant detail page from the cached row info (href / button
+    id collected once by BULK_ROW_JS); the table is only re-fetched as a
+    fallback when the cached info is unusable. With a direct href the warm
+    detail tab is reused; only the JSF click fallback touches the main
+    window.
     """
     try:
         if bot.browser.current_window_handle != main_window_handle:
             bot.browser.switch_to.window(main_window_handle)
-        time.sleep(0.1)
 
-        # Re-fetch ALL rows
-        rows = WebDriverWait(bot.browser, 2).until(EC.presence_of_all_elements_located(ROW_LOCATOR))
-        
-        # Safety check: Table size shouldn't have shrunk
-        if target_index >= len(rows):
-            logging.error(f"Table index {target_index} out of bounds (found {len(rows)} rows).")
-            return False
-            
-        # DIRECT ACCESS - No Filtering
-        current_row = rows[target_index]
-        
-        # Extract ID from list view (optional, just for fallback)
-        try:
-            td_num = current_row.find_element(By.XPATH, ".//td[contains(@class,'column3') or contains(@class,'column 3')][1]")
-            mnum = BEWERBERNUMMER.search(td_num.text.strip())
-            if mnum: res["applicant_num"] = mnum.group(1)
-        except: pass
+        mnum = BEWERBERNUMMER.search((row_item.get("text") or "").strip())
+        if mnum: res["applicant_num"] = mnum.group(1)
 
-        # Find Link/Button
-        url_to_open = None
+        url_to_open = row_item.get("href")
         click_element = None
-        try:
-            link = current_row.find_element(By.XPATH, ".//a[contains(@href,'applicationEditor-flow')]")
-            url_to_open = link.get_attribute("href")
-        except NoSuchElementException:
+
+        if not url_to_open and row_item.get("btnId"):
             try:
-                click_element = current_row.find_element(By.XPATH, ".//button[contains(@id,'tableRowAction')]")
+                click_element = bot.browser.find_element(By.ID, row_item["btnId"])
             except NoSuchElementException:
-                logging.error(f"Kein Button für {res['applicant_num']}")
+                click_element = None
+
+        if not url_to_open and click_element is None:
+            # Fallback: re-fetch the table and look the row up by index
+            # (cached info stale, e.g. after a JSF re-render with new ids)
+            target_index = row_item.get("index", -1)
+            rows = WebDriverWait(bot.browser, 2).until(EC.presence_of_all_elements_located(ROW_LOCATOR))
+            if target_index < 0 or target_index >= len(rows):
+                logging.error(f"Table index {target_index} out of bounds (found {len(rows)} rows).")
                 return False
-
-        # Open
+            current_row = rows[target_index]
+            try:
+                link = current_row.find_element(*APPLICANT_LINK_XPATH)
+                url_to_open = link.get_attribute("href")
+            except NoSuchElementException:
+                try:
+                    click_element = current_row.find_element(*ROW_ACTION_BTN_XPATH)
+                except NoSuchElementException:
+                    logging.error(f"Kein Button für {res['applicant_num']}")
+                    return False
+
+        # Open - with a direct href, navigate the warm detail tab: no tab
+        # open/close wire calls and the page context (keep-alive, cache)
+        # stays warm. Only the JSF row-action fallback may open a new tab.
         initial_handles = set(bot.browser.window_handles)
         if url_to_open:
-            bot.browser.execute_script(f"window.open('{url_to_open}', '_blank');")
+            if detail_handle and detail_handle in initial_handles:
+                bot.browser.switch_to.window(detail_handle)
+            bot.browser.get(url_to_open)
         elif click_element:
             bot.browser.execute_script("arguments[0].click();", click_element)
+            try:
+                WebDriverWait(bot.browser, 10, poll_frequency=0.1).until(
+                    lambda d: len(d.window_handles) > len(initial_handles)
+                    or "applicationEditor-flow" in d.current_url
+                )
+            except Exception:
+                pass
 
-        time.sleep(0.1)
         new_handles = set(bot.browser.window_handles) - initial_handles
-        
-        if not new_handles and "applicationEditor-flow" in bot.browser.current_url:
-            # Opened in same tab
-            new_tab = main_window_handle
-        elif new_handles:
-            # Opened in new tab
-            new_tab = list(new_handles)[0]
-            bot.browser.switch_to.window(new_tab)
-        else:
+        if new_handles:
+            bot.browser.switch_to.window(list(new_handles)[0])
+        elif "applicationEditor-flow" not in bot.browser.current_url:
             return False
 
+        # readyState wait already guarantees completeness, no extra sleep
         WebDriverWait(bot.browser, 2).until(lambda d: d.execute_script("return document.readyState") == "complete")
-        time.sleep(0.1)
         return True
 
     except Exception as e:
@@ -495,63 +765,83 @@ def _navigate_to_applicant_detail_by_index(bot, target_index, main_window_handle
         return False
 
 
-def _analyze_grade_logic(pdfs, is_non_eu, res, config):
+def _analyze_grade_logic(pdfs, vpd_pdfs, grade_pdfs, is_non_eu, claimed_note,
+                         bachelor_country, ctx, sizes):
+    """
+    Pure worker function: takes only picklable inputs and returns a dict of
+    result updates instead of mutating res, so it can run in the shared OCR
+    process pool (real cores, no GIL contention with the event loop).
+    """
     ocr_note = None
     has_vpd = False
-
-    
-    vpd_pdfs = [pdf_path for pdf_path in pdfs if "vpd" in os.path.basename(pdf_path).lower()]
-    
-    grade_keywords = ["zeugnis", "certificate", "urkunde", "diploma"]
-    grade_pdfs = [
-        pdf_path for pdf_path in pdfs 
-        if any(kw in os.path.basename(pdf_path).lower() for kw in grade_keywords)
-    ]
+    details = []
 
     if vpd_pdfs:
         has_vpd = True
         logging.debug("VPD found")
-        text_vpd = ocr_text_from_pdf(vpd_pdfs[0])
-        ocr_note = extract_ocr_note(text_vpd) if text_vpd else None
-    elif not is_non_eu:
-        combined_text = "\n".join((ocr_text_from_pdf(pdf_path) or "") for pdf_path in grade_pdfs)
-        ocr_note = extract_ocr_note(combined_text) if combined_text.strip() else None
-        
+
+    if vpd_pdfs or not is_non_eu:
+        # one hybrid path: try candidates in priority order (VPD, then
+        # grade-named PDFs, then everything largest-first) and stop at the
+        # first PDF that yields a note - the 2nd/3rd OCR usually never runs
+        seen = set()
+        candidates = [
+            p for p in (
+                vpd_pdfs + grade_pdfs
+                + sorted(pdfs, key=sizes.get, reverse=True))
+            if not (p in seen or seen.add(p))
+        ]
+        # speculative submits keep the pool busy while we check in order;
+        # jobs that haven't started when we break are cancelled
+        futures = {p: _OCR_POOL.submit(get_or_ocr, p, dpi=ctx.grade_dpi)
+                   for p in candidates}
+        for pdf_path in candidates:
+            text = futures[pdf_path].result()
+            note = extract_ocr_note(text) if text else None
+            if note is not None:
+                ocr_note = note
+                break
+        for fut in futures.values():
+            fut.cancel()
+
         if ocr_note is None and pdfs:
-            # Fallback to largest PDF
-            fallback_pdf = max(pdfs, key=os.path.getsize)
-            fallback_text = ocr_text_from_pdf(fallback_pdf)
+            # rare: the quick scan found nothing - re-render the largest
+            # PDF once at higher DPI before giving up
+            fallback_text = ocr_text_from_pdf(
+                max(pdfs, key=sizes.get),
+                dpi=max(ctx.grade_dpi, GRADE_FALLBACK_DPI))
             ocr_note = extract_ocr_note(fallback_text) if fallback_text else None
 
-    res["has_vpd"] = has_vpd
-    res["ocr_note"] = ocr_note
-    
-    claimed_note = res["claimed"].get("note")
     note_used = None
-    
+    note_ok = True
+
     if ocr_note is not None:
         note_used = ocr_note
-        res["note_source"] = "OCR"
+        note_source = "OCR"
         if claimed_note and abs(ocr_note - claimed_note) >= 0.1:
-            res["details_list"].append(f"Grade mismatch (claimed: {claimed_note}, OCR: {ocr_note})")
+            details.append(f"Grade mismatch (claimed: {claimed_note}, OCR: {ocr_note})")
     else:
         note_used = claimed_note
-        res["note_source"] = "Claimed" if note_used else "None"
+        note_source = "Claimed" if note_used else "None"
 
-    if not has_vpd and res["bachelor_country"] and ocr_note and claimed_note:
-        is_consistent, converted, bav_reason = verify_grade(res["bachelor_country"], ocr_note, claimed_note)
+    if not has_vpd and bachelor_country and ocr_note and claimed_note:
+        is_consistent, converted, bav_reason = verify_grade(bachelor_country, ocr_note, claimed_note)
         if is_consistent is False and bav_reason == "BavarianMismatch":
-            res["details_list"].append("BavarianMismatch")
+            details.append("BavarianMismatch")
 
-    res["note_ok"] = True
-    req_max = getattr(config, "REQ_NOTE_MAX", 2.4)
-    
     if note_used is None:
-        res["details_list"].append(f"No usable grade found (source: {res['note_source']}).")
-        res["note_ok"] = False
-    elif note_used > req_max:
-        res["details_list"].append(f"Grade too low ({note_used} > {req_max}).")
-        res["note_ok"] = False
+        details.append(f"No usable grade found (source: {note_source}).")
+        note_ok = False
+    elif note_used > ctx.req_note_max:
+        details.append(f"Grade too low ({note_used} > {ctx.req_note_max}).")
+        note_ok = False
+
+    return {
+        "has_vpd": has_vpd,
+        "ocr_note": ocr_note,
+        "note_source": note_source,
+        "note_ok": note_ok,
+    }, details
 
         
 def _apply_search_filters(bot):
@@ -582,7 +872,6 @@ def _trigger_search_and_wait(bot):
         search_btn = WebDriverWait(bot.browser, 1).until(EC.element_to_be_clickable(
             (By.XPATH, "//button[.//span[normalize-space()='Suchen']] | //span[normalize-space()='Suchen']/parent::button | //button[contains(@id,'search')]")))
         bot.browser.execute_script("arguments[0].scrollIntoView(true);", search_btn)
-        time.sleep(0.1)
         bot.browser.execute_script("arguments[0].click();", search_btn)
         
         logging.debug("Warte auf Ergebnisse...")
@@ -592,53 +881,137 @@ def _trigger_search_and_wait(bot):
         logging.error(f"Search failed: {e}")
         return False
 
+class _CsvSink:
+    """CSV output with periodic durability: rows land in the 64 KiB file
+    buffer and are only fsync'd-to-OS every FLUSH_EVERY rows, so a mid-run
+    crash loses at most a handful of results while the hot path stays free
+    of per-row write syscalls."""
+    FLUSH_EVERY = 16
+
+    def __init__(self, path, categories):
+        self.file, self.writer = _init_csv_file(path, categories)
+        self._since_flush = 0
+
+    def writerow(self, row):
+        self.writer.writerow(row)
+        self._since_flush += 1
+        if self._since_flush >= self.FLUSH_EVERY:
+            self.file.flush()
+            self._since_flush = 0
+
+    def close(self):
+        # close() flushes whatever is still buffered
+        self.file.close()
+
+
 def _init_csv_file(path, categories):
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        header = ["ApplicantNumber", "Decision", "Reason", "BachelorCountry", "UniversityName",
-            "UniversityWhitelisted", "HasVPD", "HasBachelorCertificate", "HasTranscript",
-            "OtherDocuments", "Claimed_Grade", "OCR_Grade", "Grade_Source"]
-        header.extend([f"Claimed_{c}" for c in categories])
-        header.extend([f"OCR_{c}" for c in categories])
-        header.extend(["MatchedModules", "UnrecognizedLines", "Extraction_Method", "Evaluation_Time_Seconds"])
-        writer.writerow(header)
-
-def _write_result_to_csv(path, res, categories):
-    details_str = "; ".join(res["details_list"])
-    row = [res["applicant_num"], res["decision"], details_str, res["bachelor_country"], res["uni_name"],
+    # opened once per run; the handle stays open and rows are appended via
+    # the returned writer instead of re-opening the file per applicant
+    f = open(path, "w", newline="", encoding="utf-8", buffering=1 << 16)
+    writer = csv.writer(f)
+    header = ["ApplicantNumber", "Decision", "Reason", "BachelorCountry", "UniversityName",
+        "UniversityWhitelisted", "HasVPD", "HasBachelorCertificate", "HasTranscript",
+        "OtherDocuments", "Claimed_Grade", "OCR_Grade", "Grade_Source"]
+    header.extend([f"Claimed_{c}" for c in categories])
+    header.extend([f"OCR_{c}" for c in categories])
+    header.extend(["MatchedModules", "UnrecognizedLines", "Extraction_Method", "Evaluation_Time_Seconds"])
+    writer.writerow(header)
+    return f, writer
+
+@lru_cache(maxsize=4)
+def _category_emitter(categories_key):
+    """exec-specialized for the run's fixed category list.
+
+    Emits both category blocks as straight-line dict.get calls in fixed
+    positions instead of looping over `categories` for every row.
+    """
+    if not categories_key:
+        return lambda claimed, saved: ()
+    src = "def emit(claimed, saved):\n    return (" + ", ".join(
+        [f"claimed.get({c!r}, 0.0)" for c in categories_key]
+        + [f"saved.get({c!r}, 0.0)" for c in categories_key]) + ",)\n"
+    ns = {}
+    exec(src, ns)
+    return ns["emit"]
+
+
+def _write_result_to_csv(writer, res, categories):
+    # preallocated row (13 head fields, 2 category blocks, 4 tail fields)
+    # filled by slice assignment - no append/extend churn per applicant
+    n_cat = len(categories)
+    row = [None] * (13 + 2 * n_cat + 4)
+    row[0:13] = (res["applicant_num"], res["decision"], "; ".join(res["details_list"]),
+        res["bachelor_country"], res["uni_name"],
         "Yes" if res["is_whitelisted"] else "No", "Yes" if res["has_vpd"] else "No",
         "Yes" if res["has_bachelor"] else "No", "Yes" if res["has_transcript"] else "No",
-        ", ".join(res["other_docs"]), res["claimed"].get("note"), res["ocr_note"], res["note_source"]]
-    
-    for c in categories: row.append(res["claimed"].get(c, 0.0))
-    for c in categories: row.append(res["saved_pdf_counts"].get(c, 0.0))
-    
-    row.extend([" | ".join(res["matched_modules"]), " | ".join(res["unrecognized_lines"]), res["extraction_method"], res["duration"]])
-    with open(path, "a", newline="", encoding="utf-8") as of:
-        csv.writer(of).writerow(row)
+        ", ".join(res["other_docs"]), res["claimed"].get("note"), res["ocr_note"], res["note_source"])
+
+    emit = _category_emitter(tuple(categories))
+    row[13:13 + 2 * n_cat] = emit(res["claimed"], res["saved_pdf_counts"])
+
+    row[13 + 2 * n_cat:] = (" | ".join(res["matched_modules"]), " | ".join(res["unrecognized_lines"]),
+        res["extraction_method"], res["duration"])
+    writer.writerow(row)
 
 def _check_non_eu_status(bot):
+    # boolean JS predicate instead of find_element: the common EU case used
+    # to raise NoSuchElementException through the wire protocol, which is
+    # far more expensive than one script call returning false
     try:
-        bot.browser.find_element(By.XPATH, "//h2[contains(., 'Masterzugangsberechtigung (A)')]")
-        logging.debug("Non-EU (A).")
-        return True
-    except NoSuchElementException:
-        logging.debug("EU (D).")
+        is_non_eu = bool(bot.browser.execute_script(
+            "return !!Array.from(document.querySelectorAll('h2'))"
+            ".find(h => h.textContent.includes('Masterzugangsberechtigung (A)'));"
+        ))
+        logging.debug("Non-EU (A)." if is_non_eu else "EU (D).")
+        return is_non_eu
+    except Exception as e:
+        logging.error(f"Non-EU-Check fehlgeschlagen: {e}")
         return False
 
-def _close_tab_and_return(bot, main_handle):
+def _return_to_results(bot, main_handle, detail_handle=None):
+    """Switch back to the results window. The warm detail tab is kept for
+    the next applicant; only stray tabs from the click fallback are closed."""
     try:
-        if bot.browser.current_window_handle != main_handle:
+        current = bot.browser.current_window_handle
+        if current not in (main_handle, detail_handle):
+            # fallback path opened an extra tab - close it
             bot.browser.close()
+            current = None
+        if current != main_handle:
             bot.browser.switch_to.window(main_handle)
+        if "applicationEditor-flow" in bot.browser.current_url:
+            # click fallback navigated the results window in place:
+            # history.back() restores the list from cache instead of
+            # re-running the search
+            bot.browser.back()
+            WebDriverWait(bot.browser, 5, poll_frequency=0.1).until(
+                lambda d: "applicationEditor-flow" not in d.current_url
+            )
     except Exception as e:
-        logging.error(f"Error closing tab: {e}")
+        logging.error(f"Error returning to results: {e}")
+
+def _close_detail_tab(bot, main_handle, detail_handle):
+    try:
+        if detail_handle in bot.browser.window_handles:
+            bot.browser.switch_to.window(detail_handle)
+            bot.browser.close()
+        bot.browser.switch_to.window(main_handle)
+    except Exception as e:
+        logging.debug(f"Detail-Tab nicht schließbar: {e}")
 
 def _handle_application_buttons(bot):
     try:
-        btns = bot.browser.find_elements(By.XPATH, "//button[contains(@id, 'showRequestSubjectBtn')]")
-        if btns:
-            bot.browser.execute_script("arguments[0].click();", btns[0])
-            WebDriverWait(bot.browser, 2).until(lambda d: d.execute_script("return document.readyState") == "complete")
-            time.sleep(0.1)
+        # find + click in one wire call; returns whether a button existed
+        clicked = bot.browser.execute_script(
+            "var b = document.querySelector(\"button[id*='showRequestSubjectBtn']\");"
+            "if (b) { b.click(); return true; } return false;"
+        )
+        if clicked:
+            # wait for the subject section the click reveals, not a fixed delay
+            WebDriverWait(bot.browser, 2, poll_frequency=0.1).until(
+                lambda d: d.execute_script(
+                    "return document.readyState === 'complete'"
+                    " && !!document.querySelector(\"[id*='requestSubject']\")"
+                )
+            )
     except Exception: pass
@@ -1,5 +1,5 @@
-import time
 import logging
+import contextlib
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -7,12 +7,41 @@ from selenium.webdriver.support import expected_conditions as EC
 
 
 class BrowserAutomation:
-    def __init__(self, options=None):
-        if options:
-            self.browser = webdriver.Chrome(options=options)
-        else:
-            self.browser = webdriver.Chrome()
+    def __init__(self, options=None, debugger_address=None):
+        self.browser = None
+
+        if debugger_address:
+            # try to attach to an already-running Chrome (skips cold start)
+            try:
+                attach_options = webdriver.ChromeOptions()
+                attach_options.add_experimental_option(
+                    "debuggerAddress", debugger_address)
+                self.browser = webdriver.Chrome(options=attach_options)
+                logging.info(f"Attached to running Chrome at {debugger_address}")
+            except Exception:
+                logging.debug(
+                    f"No Chrome at {debugger_address}, starting fresh")
+
+        if self.browser is None:
+            if options:
+                self.browser = webdriver.Chrome(options=options)
+            else:
+                self.browser = webdriver.Chrome()
         self.wait = WebDriverWait(self.browser, 2)
+        # invariant: no implicit wait - mixing implicit and explicit waits
+        # multiplies latency (every find_element inside an EC condition
+        # would block for the implicit timeout on a miss). All call sites
+        # use WebDriverWait; use self.implicit() if one really needs it.
+        self.browser.implicitly_wait(0)
+
+    @contextlib.contextmanager
+    def implicit(self, seconds):
+        """Temporarily enable an implicit wait for legacy call sites."""
+        self.browser.implicitly_wait(seconds)
+        try:
+            yield
+        finally:
+            self.browser.implicitly_wait(0)
 
     def open_url(self, url: str):
         self.browser.get(url)
@@ -38,12 +67,11 @@ class BrowserAutomation:
         #    logging.warn("sichtbarkeit manuell (?)")
 
     def add_input(self, by: By, value: str, text: str):
-        """auf DOM praesenz warten"""
+        """auf Interagierbarkeit warten (kein fixes sleep)"""
         try:
             field = WebDriverWait(self.browser, 2).until(
-                EC.presence_of_element_located((by, value))
+                EC.element_to_be_clickable((by, value))
             )
-            time.sleep(0.1)
             self.browser.execute_script(
                 "arguments[0].scrollIntoView(true);", field)
             field.clear()
@@ -1,130 +1,185 @@
 import re
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import logging
+from functools import lru_cache
 
 
 NOTE_STRICT_RE = re.compile(r"\b([0-6][.,]\d+)\b")
 NOTE_WEAK_RE = re.compile(r"(\d+(?:[.,]\d+)?)")
 
+# one wire call that collects every label/value pair the claimed-data
+# extraction needs. Each WebDriverWait/find_element is a synchronous HTTP
+# round-trip to the driver, so the old per-label lookups (1 + N siblings)
+# dominated extraction latency; here the browser walks its own DOM once and
+# Python only parses the returned blob. Run via execute_async_script: when
+# JSF is still patching the page the harvest resolves from a
+# MutationObserver the moment the labels appear, instead of Python polling
+# over the wire.
+_HARVEST_JS = r"""
+const done = arguments[arguments.length - 1];
+
+function harvest() {
+    const norm = el => (el.textContent || '').replace(/\s+/g, ' ').trim();
+    function nextDiv(lab) {
+        let e = lab.nextElementSibling;
+        while (e && e.tagName !== 'DIV') e = e.nextElementSibling;
+        return e;
+    }
+    function divSpanText(lab) {
+        const d = nextDiv(lab);
+        if (!d) return null;
+        const s = d.querySelector('span');
+        return ((s ? s.textContent : d.textContent) || '').trim();
+    }
+    const labels = Array.from(document.querySelectorAll('label'));
+
+    let noteText = null;
+    const mzb = labels.find(l => norm(l) === 'Ergebnis MZB-Note');
+    if (mzb) {
+        const nid = mzb.getAttribute('for');
+        if (nid) {
+            const host = document.getElementById(nid);
+            const sp = host ? host.querySelector('span') : null;
+            if (sp) noteText = (sp.textContent || '').trim();
+        }
+    }
+
+    let noteFallback = null;
+    const avg = labels.find(l => norm(l).includes('Bisherige Durchschnitt'));
+    if (avg) noteFallback = divSpanText(avg);
+
+    const cp = [];
+    for (const l of labels) {
+        const t = norm(l);
+        if (!t.includes('CP im Bereich')) continue;
+        const sib = l.nextElementSibling;
+        cp.push({label: t, value: sib ? (sib.textContent || '').trim() : ''});
+    }
+
+    let country = null;
+    const cl = labels.find(l => norm(l) ===
+        'Land des Bachelorstudiums (oder eines äquivalenten Abschlusses)');
+    if (cl) country = divSpanText(cl);
+
+    let uni = null;
+    const ul = labels.find(l => norm(l).includes('Name der Hochschule'));
+    if (ul) uni = divSpanText(ul);
+
+    const found = noteText || noteFallback || cp.length || country || uni;
+    return found ? {noteText: noteText, noteFallback: noteFallback, cp: cp,
+                    country: country, uni: uni} : null;
+}
+
+const first = harvest();
+if (first) { done(first); return; }
+
+const obs = new MutationObserver(() => {
+    const r = harvest();
+    if (r) { obs.disconnect(); clearTimeout(timer); done(r); }
+});
+obs.observe(document.documentElement, {childList: true, subtree: true});
+const timer = setTimeout(() => {
+    obs.disconnect();
+    done(harvest() || {});
+}, 1500);
+"""
+
+
+@lru_cache(maxsize=4)
+def _label_matcher(dom_items, categories):
+    """One compiled alternation over the dom_map keys plus the category
+    names, replacing the nested substring loops per label. Longest keys
+    first so the most specific match wins; on equal keys the dom_map
+    mapping takes priority over the plain category name."""
+    by_key = {}
+    for k, cat in dom_items:
+        by_key.setdefault(k.lower(), cat)
+    for c in categories:
+        by_key.setdefault(c.lower(), c)
+    if not by_key:
+        return None, by_key
+    pattern = re.compile("|".join(
+        sorted(map(re.escape, by_key), key=len, reverse=True)))
+    return pattern, by_key
+
+
 def _floatcast(s):
     if not s: return None
-    return float(s.replace(",", "."))
+    # most values use a plain '.' decimal - skip the replace-allocation
+    # and only rewrite the German ',' form
+    return float(s) if "," not in s else float(s.replace(",", "."))
+
+
+def _harvest_dom(browser):
+    try:
+        return browser.execute_async_script(_HARVEST_JS) or {}
+    except Exception as e:
+        logging.error(f"DOM-Harvest fehlgeschlagen: {e}")
+        return {}
+
 
 def extract_claimed_from_dom(browser, config):
-    claimed = _extract_claimed(browser, config)
-    bachelor_country_raw = extract_bachelor_country_from_dom(browser)
+    dom = _harvest_dom(browser)
+    claimed = _extract_claimed(dom, config)
+    bachelor_country_raw = (dom.get("country") or "").strip()
     claimed["bachelor_country_raw"] = bachelor_country_raw
     claimed["bachelor_country"] = bachelor_country_raw
+    # university rides along in the same harvest - callers that need it can
+    # read it here instead of issuing a second wire call
+    claimed["uni_name"] = (dom.get("uni") or "").strip()
     return claimed
 
-def _extract_claimed(browser, config):
+
+def _extract_claimed(dom, config):
     categories = list(getattr(config, "REQUIREMENTS", {}).keys())
     dom_map = getattr(config, "DOM_ECTS_MAP", {})
     claimed = {"note": None}
     for c in categories:
         claimed[c] = 0.0
 
-    try:
-        label = WebDriverWait(browser, 1).until(
-            EC.presence_of_element_located(
-                (By.XPATH, "//label[normalize-space(.)='Ergebnis MZB-Note']")
-            )
-        )
-        nid = label.get_attribute("for")
-        if nid:
-            el = browser.find_element(By.XPATH, f"//div[@id='{nid}']//span")
-            m = NOTE_STRICT_RE.search(el.text.strip())
-            if m:
-                claimed["note"] = _floatcast(m.group(1))
-    except Exception:
-        pass
+    m = NOTE_STRICT_RE.search(dom.get("noteText") or "")
+    if m:
+        claimed["note"] = _floatcast(m.group(1))
 
     if claimed["note"] is None:
-        fallback_paths = [
-            "//label[contains(normalize-space(.),'Bisherige Durchschnitt')]/following-sibling::div[1]//span",
-        ]
-        for xp in fallback_paths:
-            try:
-                el = WebDriverWait(browser, 1).until(
-                    EC.presence_of_element_located((By.XPATH, xp))
-                )
-                m = NOTE_STRICT_RE.search(el.text.strip())
-                if m:
-                    claimed["note"] = _floatcast(m.group(1))
-                    break
-            except Exception:
-                pass
-
-    try:
-        labels = browser.find_elements(
-            By.XPATH,
-            "//label[contains(normalize-space(.),'CP im Bereich')]"
-        )
-        for lab in labels:
-            t = lab.text.strip().lower()
-            cat_found = None
-
-            for dom_key, mapped_cat in dom_map.items():
-                if dom_key.lower() in t:
-                    cat_found = mapped_cat
-                    break
-
-            if not cat_found:
-                for cat in categories:
-                    if cat.lower() in t:
-                        cat_found = cat
-                        break
-
-            if not cat_found:
-                continue
-            
-            sib = lab.find_element(By.XPATH, "following-sibling::*[1]")
-            m = NOTE_WEAK_RE.search(sib.text.strip())
+        m = NOTE_STRICT_RE.search(dom.get("noteFallback") or "")
+        if m:
+            claimed["note"] = _floatcast(m.group(1))
+
+    classify_module = getattr(config, "classify_module", None)
+    label_re, by_key = _label_matcher(tuple(dom_map.items()),
+                                      tuple(categories))
+    for item in dom.get("cp") or []:
+        t = (item.get("label") or "").strip().lower()
+        cat_found = None
+
+        if classify_module is not None:
+            # single multi-pattern regex pass provided by the config
+            cat_found = classify_module(t)
+
+        if not cat_found and label_re is not None:
+            # one linear scan over the label instead of a loop over every
+            # dom_map key and category
+            m = label_re.search(t)
             if m:
-                claimed[cat_found] += _floatcast(m.group(1))
-    except Exception:
-        pass
+                cat_found = by_key[m.group(0)]
+
+        if not cat_found:
+            continue
+
+        m = NOTE_WEAK_RE.search((item.get("value") or "").strip())
+        if m:
+            claimed[cat_found] += _floatcast(m.group(1))
 
     return claimed
 
 
 def extract_bachelor_country_from_dom(browser) -> str:
-    """
-    Reads the DOM field:
-      '
-    """
-    try:
-        label = WebDriverWait(browser, 1).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//label[normalize-space(.)="
-                    "'Land des Bachelorstudiums (oder eines äquivalenten Abschlusses)']"
-                )
-            )
-        )
-        val_el = label.find_element(
-            By.XPATH,
-            "./following-sibling::div[1]//span"
-        )
-        return val_el.text.strip()
-    except Exception:
-        return ""
+    """Standalone variant; extract_claimed_from_dom already carries the
+    country from the same single harvest."""
+    return (_harvest_dom(browser).get("country") or "").strip()
 
 
 def get_university_from_dom(browser):
-    try:
-        label = WebDriverWait(browser, 1).until(
-            EC.presence_of_element_located(
-                (By.XPATH,
-                 "//label[contains(normalize-space(.),'Name der Hochschule')]")
-            )
-        )
-        v = label.find_element(
-            By.XPATH,
-            "./following-sibling::div[1]//span"
-        ).text.strip()
-        return v
-    except Exception:
-        return ""
+    """Standalone variant; extract_claimed_from_dom already carries the
+    university name from the same single harvest."""
+    return (_harvest_dom(browser).get("uni") or "").strip()
@@ -1,13 +1,28 @@
 #!/usr/bin/env python3
 import os
 import re
+import json
 import logging
 import tqdm
+from functools import partial
+from itertools import islice
 from typing import Dict, List, Tuple
 
 # Import the centralized OCR logic
-from .ocr_ects import ocr_text_from_pdf
-from .ocr_engine import normalize_text
+from .ocr_ects import ocr_text_from_pdf, _compute_file_hash, get_ocr_pool
+
+# on-disk classification cache keyed by (content hash, program): the same
+# PDF re-uploaded under a new name / in a later run never hits OCR again
+_CLASSIFY_CACHE_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "..", "ressources", "classify_cache"))
+# bump when the scorers or the threshold change, so stale cached
+# classifications from older logic are never served
+_CLASSIFY_CACHE_VERSION = "v2"
+
+# classification only needs keyword-level text, not per-glyph accuracy:
+# 120 DPI quarters the pixel count versus the 300-DPI extraction default,
+# which cuts both rasterization and tesseract time by roughly 4x
+CLASSIFY_DPI = 120
 
 TRANSCRIPT_KEYWORDS = [
     "transcript of records", "transcript of academic record", "grade report",
@@ -42,11 +57,11 @@ def score_transcript(text: str) -> int:
         score += 4
     if ECTS_RE.search(text):
         score += 3
-    semester_count = sum(1 for _ in SEMESTER_RE.finditer(text))
-    if semester_count >= 2:
+    # the thresholds only need "at least N", so stop iterating the matches
+    # as soon as N is reached instead of counting every hit in a long text
+    if sum(1 for _ in islice(SEMESTER_RE.finditer(text), 2)) >= 2:
         score += 2
-    numeric_line_count = sum(1 for _ in LINE_WITH_DIGIT_RE.finditer(text))
-    if numeric_line_count > 20:
+    if sum(1 for _ in islice(LINE_WITH_DIGIT_RE.finditer(text), 21)) > 20:
         score += 1
     return score
 
@@ -148,30 +163,73 @@ def score_vpd(text: str) -> int:
     return score
 
 
+def _classify_cache_get(pdf_path: str, program: str):
+    cache_path = None
+    try:
+        cache_path = os.path.join(
+            _CLASSIFY_CACHE_DIR,
+            f"{_CLASSIFY_CACHE_VERSION}_{_compute_file_hash(pdf_path)}_{program}.json")
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        return cache_path, (cached["doc_type"], cached["scores"])
+    except FileNotFoundError:
+        return cache_path, None
+    except Exception as e:
+        logging.debug(f"Classify-Cache unlesbar ({e}), klassifiziere neu")
+        return None, None
+
+
+def _classify_cache_put(cache_path, doc_type, scores):
+    try:
+        os.makedirs(_CLASSIFY_CACHE_DIR, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"doc_type": doc_type, "scores": scores}, f)
+        os.replace(tmp_path, cache_path)  # atomic, no torn reads
+    except Exception as e:
+        logging.debug(f"Classify-Cache nicht schreibbar: {e}")
+
+
 def classify_document(pdf_path: str, program: str) -> Tuple[str, Dict[str, int]]:
     logging.debug(f"Classifying: {os.path.basename(pdf_path)}")
-    
+
+    cache_path, cached = _classify_cache_get(pdf_path, program)
+    if cached is not None:
+        return cached
+
     # -------------------------------------------------------------
-    # OPTIMIZATION: Only OCR the first page for classification
+    # OPTIMIZATION: Only OCR the first page, at keyword-grade DPI
     # -------------------------------------------------------------
-    text = ocr_text_from_pdf(pdf_path, max_pages=1)
+    text = ocr_text_from_pdf(pdf_path, dpi=CLASSIFY_DPI, max_pages=1)
     
     if not text or text.isspace():
         return "other", {"transcript": 0, "language_certificate": 0, "degree_certificate": 0, "vpd": 0}
 
-    scores = {
-        "transcript": score_transcript(text),
-        "language_certificate": score_language_cert(text, program),
-        "degree_certificate": score_degree_certificate(text),
-        "vpd": score_vpd(text)
-    }
+    # Scorers ordered by signal strength, with early exits on decisive
+    # hits: a VPD keyword match (score >= 6) is unambiguous - VPDs never
+    # double as transcripts - and a transcript at >= 7 cannot be overtaken
+    # by the remaining scorers (both capped at 7, and a tie resolves to
+    # the earlier key exactly like the old dict-ordered max did). Saves
+    # 2-3 full regex passes over the text in the common cases.
+    scores = {"transcript": 0, "language_certificate": 0,
+              "degree_certificate": 0, "vpd": 0}
 
-    best_type = max(scores, key=scores.get)
-    best_score = scores[best_type]
+    scores["vpd"] = score_vpd(text)
+    if scores["vpd"] >= 6:
+        doc_type = "vpd"
+    else:
+        scores["transcript"] = score_transcript(text)
+        if scores["transcript"] >= 7:
+            doc_type = "transcript"
+        else:
+            scores["language_certificate"] = score_language_cert(text, program)
+            scores["degree_certificate"] = score_degree_certificate(text)
+            best_type = max(scores, key=scores.get)
+            # Threshold: If the best match is weak, call it 'other'
+            doc_type = best_type if scores[best_type] >= 2 else "other"
 
-    # Threshold: If the best match is weak, call it 'other'
-    doc_type = best_type if best_score >= 2 else "other"
-    
+    if cache_path:
+        _classify_cache_put(cache_path, doc_type, scores)
     return doc_type, scores
 
 
@@ -187,10 +245,21 @@ def classify_many(pdf_paths: List[str], program: str):
     best_transcript = (None, None)
     best_transcript_score = -1
 
-    for pdf_path in tqdm.tqdm(pdf_paths, desc="Classifying attached documents...", leave=False):
-        doc_type, scores = classify_document(pdf_path, program)
+    # per-PDF OCR is fully independent and CPU-bound, so batches fan out
+    # over the shared OCR process pool; a single PDF skips the pickle/IPC
+    # overhead and runs inline
+    if len(pdf_paths) > 1:
+        results = list(tqdm.tqdm(
+            get_ocr_pool().map(
+                partial(classify_document, program=program), pdf_paths),
+            total=len(pdf_paths),
+            desc="Classifying attached documents...", leave=False))
+    else:
+        results = [classify_document(p, program) for p in pdf_paths]
+
+    for pdf_path, (doc_type, scores) in zip(pdf_paths, results):
         by_type.setdefault(doc_type, []).append(pdf_path)
-        
+
         # Track the 'strongest' transcript candidate
         if doc_type == "transcript":
             sc = scores.get("transcript", 0)
@@ -4,12 +4,46 @@ import time
 import shutil
 import zipfile
 import logging
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# one wire call that collects any direct PDF links on the detail page
+PDF_ANCHOR_JS = (
+    "return Array.from(document.querySelectorAll(\"a[href$='.pdf']\"))"
+    ".map(a => a.href);"
+)
+
+
+def _download_direct_pdfs(browser, urls, target_dir, timeout=30) -> List[str]:
+    """
+    Fetch per-PDF URLs concurrently with the browser's session cookie:
+    no zip generation on the server, and the network latencies overlap.
+    """
+    cookie_header = "; ".join(
+        f"{c['name']}={c['value']}" for c in browser.get_cookies())
+    os.makedirs(target_dir, exist_ok=True)
+
+    def fetch(url):
+        name = os.path.basename(url.split("?")[0])
+        if not name.lower().endswith(".pdf") or "deckblatt" in name.lower():
+            return None
+        req = urllib.request.Request(url, headers={"Cookie": cookie_header})
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            data = resp.read()
+        path = os.path.join(target_dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as ex:
+        results = list(ex.map(fetch, urls))
+    return [p for p in results if p]
+
 def wait_for_any_file(download_dir, pattern="*.zip", timeout=40, prev=None):
     prev_set = set(prev or glob.glob(os.path.join(download_dir, pattern)))
     deadline = time.time() + timeout
@@ -54,6 +88,25 @@ def extract_pdfs_from_zip(zip_path, target_dir) -> List[str]:
 def download_pdfs_for_applicant(browser, download_dir, extract_dir, applicant_num):
     logging.debug(f"working on: Download-Button {applicant_num}")
 
+    # Opportunistic fast path: if the detail page exposes direct PDF links,
+    # fetch them in parallel over HTTP and skip the zip-export flow
+    # entirely. HISinOne usually routes through the zip button, so this is
+    # best-effort and falls through on any miss.
+    try:
+        pdf_urls = browser.execute_script(PDF_ANCHOR_JS)
+    except Exception:
+        pdf_urls = []
+    if pdf_urls:
+        direct_target = os.path.join(
+            extract_dir, f"{applicant_num}_{int(time.time())}")
+        try:
+            pdfs = _download_direct_pdfs(browser, pdf_urls, direct_target)
+            if pdfs:
+                logging.debug(f"{len(pdfs)} PDFs direkt geladen (ohne Zip-Export)")
+                return pdfs
+        except Exception as e:
+            logging.debug(f"Direkt-Download fehlgeschlagen ({e}), nutze Zip-Export")
+
     # OPTIMIZATION: Combine XPaths into one OR-query.
     # This checks all 4 conditions simultaneously.
     combined_xpath = (
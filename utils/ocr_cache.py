@@ -0,0 +1,49 @@
+"""Persistent OCR text cache keyed by PDF content hash.
+
+The in-memory caches in ocr_ects only live for one process; identical PDFs
+show up constantly across runs (re-uploaded VPDs and transcripts, repeated
+development runs over the same download set), so extracted text is also
+kept on disk under ressources/ocr_cache - a hash lookup instead of seconds
+of Tesseract.
+"""
+import os
+import logging
+
+from utils.ocr_ects import _compute_file_hash, extract_text_smart
+
+CACHE_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "..", "ressources", "ocr_cache"))
+
+
+def get_or_ocr(pdf_path, dpi=None, max_pages=None):
+    """Text for pdf_path from the disk cache, extracting on a miss.
+
+    The cache key includes dpi/max_pages so a first-page preview never
+    shadows a full extraction (same convention as the in-memory cache).
+    """
+    cache_path = None
+    try:
+        key = _compute_file_hash(pdf_path)
+        cache_path = os.path.join(CACHE_DIR, f"{key}_{dpi}_{max_pages}.txt")
+        with open(cache_path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.debug(f"OCR-Cache unlesbar ({e}), extrahiere neu")
+
+    kwargs = {"max_pages": max_pages}
+    if dpi is not None:
+        kwargs["dpi"] = dpi
+    text = extract_text_smart(pdf_path, **kwargs)
+
+    if cache_path and text:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)  # atomic, no torn reads
+        except Exception as e:
+            logging.debug(f"OCR-Cache nicht schreibbar: {e}")
+    return text
@@ -21,6 +21,11 @@ except ImportError:
     convert_from_path = None
     pytesseract = None
 
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
 # ==============================================================================
 # 1. GLOBAL CONFIGURATION & ENVIRONMENT SETUP
 # ==============================================================================
@@ -53,6 +58,9 @@ _FILE_HASH_CACHE: Dict[str, str] = {}
 # Cache Key: (file_hash, dpi, psm, max_pages)
 
 _OCR_TEXT_CACHE: Dict[tuple, str] = {}
+# bound the text cache to roughly the PDFs of the applicants currently in
+# flight - full OCR texts are large and a run can touch hundreds of PDFs
+_OCR_TEXT_CACHE_MAX = 64
 
 _OCR_POOL = None
 
@@ -190,9 +198,70 @@ def ocr_text_from_pdf(pdf_path: str, dpi: int = CONFIG.DPI, max_pages: Optional[
 
     full_text = "\n".join(text_parts)
     _OCR_TEXT_CACHE[cache_key] = full_text
+    while len(_OCR_TEXT_CACHE) > _OCR_TEXT_CACHE_MAX:
+        # evict oldest insertion (dicts iterate in insertion order)
+        _OCR_TEXT_CACHE.pop(next(iter(_OCR_TEXT_CACHE)))
     return full_text
 
 
+_EMBEDDED_TEXT_CACHE: Dict[str, Optional[str]] = {}
+
+def embedded_text_from_pdf(pdf_path: str, min_chars: int = 200) -> Optional[str]:
+    """
+    Fast path for digital PDFs: return the embedded text layer, or None if
+    there is none (scanned document) or it is too sparse to trust - in that
+    case the caller should fall back to ocr_text_from_pdf.
+    """
+    if pdfplumber is None:
+        return None
+
+    file_hash = _compute_file_hash(pdf_path)
+    if file_hash in _EMBEDDED_TEXT_CACHE:
+        return _EMBEDDED_TEXT_CACHE[file_hash]
+
+    text = None
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            joined = "\n".join(page.extract_text() or "" for page in pdf.pages)
+        if len(joined.strip()) >= min_chars:
+            text = joined
+    except Exception as e:
+        logging.debug(f"Kein Textlayer in {os.path.basename(pdf_path)}: {e}")
+    _EMBEDDED_TEXT_CACHE[file_hash] = text
+    return text
+
+
+def extract_text_smart(pdf_path: str, dpi: int = CONFIG.DPI,
+                       max_pages: Optional[int] = None,
+                       ocr_threshold: int = 200) -> str:
+    """
+    Text from a PDF by the cheapest means available: the embedded text
+    layer when it holds at least ocr_threshold characters, OCR otherwise.
+    """
+    text = embedded_text_from_pdf(pdf_path, min_chars=ocr_threshold)
+    if text is not None:
+        return text
+    return ocr_text_from_pdf(pdf_path, dpi=dpi, max_pages=max_pages)
+
+
+def ocr_text_from_pdfs_batch(pdf_paths: List[str], dpi: int = CONFIG.DPI,
+                             max_pages: Optional[int] = None) -> Dict[str, str]:
+    """
+    Extract text for a batch of PDFs in one call, returning a path -> text
+    map. pytesseract shells out one tesseract process per call, so the
+    thread fan-out genuinely overlaps them; language-data loading is
+    amortized by the OS page cache across the processes.
+    """
+    if not pdf_paths:
+        return {}
+    with ThreadPoolExecutor(
+            max_workers=min(len(pdf_paths), CONFIG.MAX_WORKERS)) as ex:
+        texts = ex.map(
+            lambda p: extract_text_smart(p, dpi=dpi, max_pages=max_pages),
+            pdf_paths)
+    return dict(zip(pdf_paths, texts))
+
+
 # ==============================================================================
 # 4. BUSINESS LOGIC (Evaluation/Extraction)
 # ==============================================================================
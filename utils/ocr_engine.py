@@ -5,7 +5,9 @@ import logging
 from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
+from functools import lru_cache
 
+import numpy as np
 from PIL import Image
 Image.MAX_IMAGE_PIXELS = 933120000
 from pdf2image import convert_from_path
@@ -332,31 +334,50 @@ def _resolve_conflicts_keep_specific(mods):
     return kept
 
 
+@lru_cache(maxsize=8)
+def _module_matcher(modules):
+    """One compiled alternation over all normalized module names.
+
+    Longest names first, so the most specific module wins on overlaps -
+    the same longest-match-first idea as the sorted mapping, but as a
+    single scan per line instead of one substring test per module.
+    """
+    by_norm = {}
+    for mod in modules:
+        mod_norm = normalize_text(mod.name)
+        if mod_norm:
+            by_norm.setdefault(mod_norm, mod)
+    if not by_norm:
+        return None, by_norm
+    pattern = re.compile(
+        "|".join(sorted(map(re.escape, by_norm), key=len, reverse=True)))
+    return pattern, by_norm
+
+
 def match_modules_in_row(row_text, module_map, allow_fuzzy=True):
 
     text_norm = normalize_text(row_text)
     if not text_norm:
         return []
 
-    strict_hits = []
-    fuzzy_hits = []
+    pattern, by_norm = _module_matcher(tuple(module_map))
+    if pattern is None:
+        return []
 
-    for mod in module_map:
-        mod_norm = normalize_text(mod.name)
-        if not mod_norm:
-            continue
+    # strict phase: one regex scan over the line instead of a loop over
+    # every known module
+    strict_hits = [by_norm[m] for m in dict.fromkeys(pattern.findall(text_norm))]
+    if strict_hits:
+        return _resolve_conflicts_keep_specific(strict_hits)
 
-        if mod_norm in text_norm:
-            strict_hits.append(mod)
-        elif allow_fuzzy:
+    if allow_fuzzy:
+        fuzzy_hits = []
+        for mod_norm, mod in by_norm.items():
             score = SequenceMatcher(None, mod_norm, text_norm).ratio()
             if score >= FUZZY_THRESHOLD:
                 fuzzy_hits.append(mod)
-
-    if strict_hits:
-        return _resolve_conflicts_keep_specific(strict_hits)
-    if fuzzy_hits:
-        return _resolve_conflicts_keep_specific(fuzzy_hits)
+        if fuzzy_hits:
+            return _resolve_conflicts_keep_specific(fuzzy_hits)
     return []
 
 
@@ -394,9 +415,7 @@ def extract_ects_ocr(pdf_path, module_map_dict, categories):
     
     line_matches = []
     col_matches = []
-    ects_per_cat_line = {cat: 0.0 for cat in categories}
-    ects_per_cat_col = {cat: 0.0 for cat in categories}
-    
+
     # Accumulate data from all pages
     with ThreadPoolExecutor(max_workers=OCR_THREADS) as executor:
         results = executor.map(_process_page_optimized, pages)
@@ -425,7 +444,6 @@ def extract_ects_ocr(pdf_path, module_map_dict, categories):
                 
                 if key not in line_seen:
                     line_seen.add(key)
-                    ects_per_cat_line[m.category] += ects_val
                     line_matches.append((m.name, m.category, ects_val, ln))
 
         # C. Strategy 2: Column-based extraction (if column detected)
@@ -444,11 +462,13 @@ def extract_ects_ocr(pdf_path, module_map_dict, categories):
                     key = (m.name, m.category, ects_val)
                     if key not in col_seen:
                         col_seen.add(key)
-                        ects_per_cat_col[m.category] += ects_val
                         col_matches.append((m.name, m.category, ects_val, row["text"]))
 
     # 5. Final Selection (Best Strategy)
-    total_line = sum(ects_per_cat_line.values())
+    # One vectorized reduction per strategy instead of a dict update per
+    # matched line above.
+    ects_per_cat_line = _sum_by_category(line_matches, categories)
+    ects_per_cat_col = _sum_by_category(col_matches, categories)
     total_col = sum(ects_per_cat_col.values())
 
     # We prefer column extraction if it yields results, as it validates the number position
@@ -462,5 +482,18 @@ def extract_ects_ocr(pdf_path, module_map_dict, categories):
         best_matches = [f"{n} -> {c}:{e} | {txt}" for (n, c, e, txt) in line_matches]
         best_method = "ocr_optimized_line"
 
-    best_sums = {k: round(float(v), 2) for k, v in best_sums.items()}
     return best_sums, best_matches, [], best_method
+
+
+def _sum_by_category(matches, categories):
+    """Per-category ECTS sums as a single np.add.at scatter-add."""
+    sums = np.zeros(len(categories), dtype=np.float64)
+    if matches:
+        cat_to_idx = {c: i for i, c in enumerate(categories)}
+        n = len(matches)
+        cat_idx = np.fromiter((cat_to_idx[c] for (_, c, _, _) in matches),
+                              dtype=np.intp, count=n)
+        ects = np.fromiter((e for (_, _, e, _) in matches),
+                           dtype=np.float64, count=n)
+        np.add.at(sums, cat_idx, ects)
+    return {c: round(float(v), 2) for c, v in zip(categories, sums)}